@@ -54,6 +54,12 @@ class Settings(BaseSettings):
     semantic_search_limit: int = 5
     semantic_similarity_threshold: float = 0.7
     semantic_context_window: int = 3
+    hnsw_ef_search: int = 100  # HNSW candidate list size (higher = better recall, slower)
+
+    # Query Embedding Cache (empty path = memory only)
+    embedding_cache_path: str = "/tmp/ai-api/embedding_cache.db"
+    embedding_cache_memory_size: int = 256
+    embedding_cache_max_entries: int = 10000  # ~12KB each on disk
 
     # Knowledge Base
     kb_upload_dir: str = "/tmp/knowledge_base"
@@ -79,6 +85,10 @@ class Settings(BaseSettings):
     # WhatsApp Client
     whatsapp_client_url: str = "http://localhost:3001"
     whatsapp_client_timeout: int = 30
+    whatsapp_max_concurrency: int = 20  # Max requests in flight to the WhatsApp client
+
+    # Shared HTTP client (agent tools, per-request timeouts override it)
+    http_client_timeout: int = 30
 
     # External APIs
     jina_api_key: str | None = None  # Optional, for higher rate limits (500 vs 20 RPM)
@@ -28,6 +28,24 @@ class ConversationType(str, Enum):
 
 engine = create_engine(settings.database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# HNSW indexes for semantic search (table -> index name).
+# pgvector can't index `vector` columns over 2000 dimensions, so the 3072-dim
+# embeddings are indexed as halfvec expressions. Search queries must order by
+# `embedding::halfvec(3072) <=> ...` for the planner to use them. Built by
+# ai_api.scripts.create_vector_indexes, not on startup.
+HNSW_INDEXES = {
+    "conversation_messages": "idx_conversation_messages_embedding_hnsw",
+    "knowledge_base_chunks": "idx_kb_chunks_embedding_hnsw",
+}
+
+# pgvector releases the search code depends on: halfvec (0.7) and
+# hnsw.iterative_scan (0.8)
+PGVECTOR_HALFVEC_VERSION = (0, 7)
+PGVECTOR_ITERATIVE_SCAN_VERSION = (0, 8)
+
+# Installed pgvector version, read once per process
+_pgvector_version: tuple[int, ...] | None = None
 Base = declarative_base()
 
 
@@ -128,13 +146,109 @@ def init_db():
     with engine.connect() as conn:
         conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         conn.commit()
-    logger.info("pgvector extension enabled")
+
+        version = get_pgvector_version(conn)
+    logger.info(f"pgvector extension enabled (version {'.'.join(map(str, version))})")
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
+
+    # Extension upgrades and HNSW index builds are slow one-off migrations, they
+    # run from ai_api.scripts.create_vector_indexes instead of blocking startup
+    if version < PGVECTOR_HALFVEC_VERSION:
+        logger.warning(
+            f"pgvector {'.'.join(map(str, version))} is too old, semantic search needs >= 0.7. "
+            "Run `pnpm db:indexes` to upgrade the extension"
+        )
+    else:
+        with engine.connect() as conn:
+            missing = get_missing_vector_indexes(conn)
+        if missing:
+            logger.warning(
+                f"HNSW vector indexes missing or invalid ({', '.join(missing)}), "
+                "semantic search will scan sequentially. Run `pnpm db:indexes` to build them"
+            )
+
     logger.info("Database initialized successfully")
 
 
+def get_missing_vector_indexes(db) -> list[str]:
+    """
+    List HNSW indexes that don't exist yet or were left invalid by an interrupted build.
+
+    Args:
+        db: Database session or connection
+
+    Returns:
+        Names of the HNSW indexes (see HNSW_INDEXES) that can't serve queries
+    """
+    index_names = [
+        index_name
+        for table_name, index_name in HNSW_INDEXES.items()
+        if table_name in Base.metadata.tables
+    ]
+    valid = db.execute(
+        text("""
+            SELECT c.relname
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = ANY(:names) AND i.indisvalid
+        """),
+        {"names": index_names},
+    ).scalars()
+    return sorted(set(index_names) - set(valid))
+
+
+def get_pgvector_version(db) -> tuple[int, ...]:
+    """
+    Get the installed pgvector extension version (cached per process).
+
+    Args:
+        db: Database session or connection
+
+    Returns:
+        Version tuple, e.g. (0, 8, 1), or (0,) if the extension is missing
+    """
+    global _pgvector_version
+
+    if _pgvector_version is None:
+        version = db.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        ).scalar()
+        _pgvector_version = tuple(int(part) for part in version.split(".")) if version else (0,)
+
+    return _pgvector_version
+
+
+def set_hnsw_search_params(db) -> None:
+    """
+    Tune HNSW index scans for the current transaction.
+
+    ef_search trades speed for recall. Iterative scans keep fetching
+    candidates when WHERE filters (user, threshold, document status)
+    discard most of the first batch, so filtered searches still fill LIMIT.
+    They need pgvector 0.8+ and are skipped on older versions, which would
+    reject the unknown setting.
+
+    Args:
+        db: Database session
+    """
+    if get_pgvector_version(db) >= PGVECTOR_ITERATIVE_SCAN_VERSION:
+        db.execute(
+            text("""
+                SELECT
+                    set_config('hnsw.ef_search', :ef_search, true),
+                    set_config('hnsw.iterative_scan', 'strict_order', true)
+            """),
+            {"ef_search": str(settings.hnsw_ef_search)},
+        )
+    else:
+        db.execute(
+            text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+            {"ef_search": str(settings.hnsw_ef_search)},
+        )
+
+
 def get_db():
     """Get database session"""
     db = SessionLocal()
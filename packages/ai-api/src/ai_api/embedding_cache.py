@@ -0,0 +1,201 @@
+"""
+Two-tier cache for query embeddings.
+
+Lookups go in-memory LRU -> SQLite file -> Gemini. The SQLite tier survives
+restarts and is shared by the API and worker processes on the same host
+(WAL mode allows concurrent readers with a single writer).
+
+Vectors are stored as float32 bytes (12KB per 3072-dim embedding), keyed by
+sha256 of model, dimensions, task type and text. Hits refresh the entry's
+timestamp, so pruning drops the least recently used entries.
+
+The memory tier runs inline on the event loop. SQLite calls run in a worker
+thread, since the file is shared between processes and a locked database
+can block for up to the connection timeout.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from .config import settings
+from .logger import logger
+
+# Trim the SQLite table back to max entries every N inserts
+PRUNE_INTERVAL = 500
+
+# In-memory LRU (key -> embedding), most recently used last.
+# Only touched from the event loop, so it needs no lock.
+_memory_cache: OrderedDict[bytes, list[float]] = OrderedDict()
+
+# Global SQLite connection (lazily opened, None when disabled or unavailable).
+# Used from worker threads, guarded by _lock.
+_connection: sqlite3.Connection | None = None
+_connection_failed = False
+_inserts_since_prune = 0
+_lock = threading.Lock()
+
+
+def make_cache_key(model: str, dimensions: int, task_type: str, text: str) -> bytes:
+    """
+    Build the cache key for an embedding request.
+
+    Args:
+        model: Embedding model name
+        dimensions: Output dimensionality
+        task_type: Gemini task type
+        text: Text being embedded (after truncation)
+
+    Returns:
+        sha256 digest (32 bytes)
+    """
+    return hashlib.sha256(f"{model}\0{dimensions}\0{task_type}\0{text}".encode()).digest()
+
+
+def _get_connection() -> sqlite3.Connection | None:
+    """
+    Get or open the SQLite connection.
+
+    Returns:
+        Connection, or None if the disk tier is disabled or failed to open
+    """
+    global _connection, _connection_failed
+
+    if _connection is not None or _connection_failed or not settings.embedding_cache_path:
+        return _connection
+
+    try:
+        path = Path(settings.embedding_cache_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS emb (k BLOB PRIMARY KEY, v BLOB NOT NULL, ts INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_emb_ts ON emb (ts)")
+        conn.commit()
+
+        _connection = conn
+        logger.info(f"Embedding cache opened: {path}")
+    except Exception as e:
+        # Cache is an optimization, fall back to memory-only
+        _connection_failed = True
+        logger.warning(f"Embedding cache disabled, failed to open SQLite file: {e}")
+
+    return _connection
+
+
+def _remember(key: bytes, embedding: list[float]) -> None:
+    """Insert into the in-memory LRU, evicting the least recently used entry."""
+    _memory_cache[key] = embedding
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > settings.embedding_cache_memory_size:
+        _memory_cache.popitem(last=False)
+
+
+def _read_disk(key: bytes) -> bytes | None:
+    """
+    Read an embedding from SQLite and mark it as recently used (worker thread).
+
+    Args:
+        key: Cache key from make_cache_key
+
+    Returns:
+        Stored float32 bytes, or None on miss or error
+    """
+    with _lock:
+        conn = _get_connection()
+        if conn is None:
+            return None
+
+        try:
+            row = conn.execute("SELECT v FROM emb WHERE k = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            conn.execute("UPDATE emb SET ts = ? WHERE k = ?", (int(time.time()), key))
+            conn.commit()
+            return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            return None
+
+
+def _write_disk(key: bytes, value: bytes) -> None:
+    """
+    Write an embedding to SQLite, pruning periodically (worker thread).
+
+    Args:
+        key: Cache key from make_cache_key
+        value: Embedding as float32 bytes
+    """
+    global _inserts_since_prune
+
+    with _lock:
+        conn = _get_connection()
+        if conn is None:
+            return
+
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO emb (k, v, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+
+            _inserts_since_prune += 1
+            if _inserts_since_prune >= PRUNE_INTERVAL:
+                _inserts_since_prune = 0
+                # Drop the least recently used entries beyond the configured cap
+                conn.execute(
+                    "DELETE FROM emb WHERE k IN "
+                    "(SELECT k FROM emb ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                    (settings.embedding_cache_max_entries,),
+                )
+
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+
+async def get_cached_embedding(key: bytes) -> list[float] | None:
+    """
+    Look up an embedding in memory, then on disk.
+
+    Args:
+        key: Cache key from make_cache_key
+
+    Returns:
+        Cached embedding, or None on miss
+    """
+    embedding = _memory_cache.get(key)
+    if embedding is not None:
+        _memory_cache.move_to_end(key)
+        return embedding
+
+    value = await asyncio.to_thread(_read_disk, key)
+    if value is None:
+        return None
+
+    embedding = np.frombuffer(value, dtype=np.float32).tolist()
+    _remember(key, embedding)
+    return embedding
+
+
+async def store_embedding(key: bytes, embedding: list[float]) -> None:
+    """
+    Store an embedding in memory and on disk.
+
+    Args:
+        key: Cache key from make_cache_key
+        embedding: Embedding vector
+    """
+    _remember(key, embedding)
+    await asyncio.to_thread(_write_disk, key, np.asarray(embedding, dtype=np.float32).tobytes())
@@ -16,6 +16,7 @@ from google import genai
 from google.genai import types
 
 from .config import settings
+from .embedding_cache import get_cached_embedding, make_cache_key, store_embedding
 from .logger import logger
 
 # Configuration constants
@@ -66,8 +67,19 @@ class EmbeddingService:
         # Truncate if too long (prevents API errors)
         text = text[: self.max_length]
 
+        # Search queries repeat across turns and restarts; stored documents don't
+        cache_key = None
+        if task_type == "RETRIEVAL_QUERY":
+            cache_key = make_cache_key(self.model, self.dimensions, task_type, text)
+            cached = await get_cached_embedding(cache_key)
+            if cached is not None:
+                logger.debug("Embedding cache hit")
+                return cached
+
         try:
-            response = self.client.models.embed_content(
+            # Async client so the request doesn't block the event loop; concurrent
+            # tool calls (e.g. both searches in one agent step) overlap their round trips
+            response = await self.client.aio.models.embed_content(
                 model=self.model,
                 contents=text,
                 config=types.EmbedContentConfig(
@@ -76,6 +88,8 @@ class EmbeddingService:
             )
             embedding = response.embeddings[0].values
             logger.debug(f"Generated embedding: {len(embedding)} dimensions (task: {task_type})")
+            if cache_key is not None:
+                await store_embedding(cache_key, embedding)
             return embedding
 
         except Exception as e:
@@ -0,0 +1,98 @@
+"""
+Shared HTTP client management.
+
+Provides a process-wide httpx.AsyncClient used by agent tools and the
+WhatsApp REST client, so keep-alive connections (and their TLS sessions)
+are reused across requests and jobs instead of being re-established for
+every chat message.
+"""
+
+import asyncio
+
+import httpx
+
+from .config import settings
+from .logger import logger
+
+# External hosts hit by agent tools (fetch_website, get_weather).
+# Warmed on startup so the first tool call doesn't pay DNS + TCP + TLS setup.
+WARMUP_URLS = (
+    "https://r.jina.ai/",
+    "https://geocoding-api.open-meteo.com/",
+    "https://api.open-meteo.com/",
+)
+
+# Global client (reused across requests and jobs)
+_http_client: httpx.AsyncClient | None = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create a new pooled HTTP client.
+
+    HTTP/2 is negotiated via ALPN with HTTPS hosts that support it, letting
+    concurrent tool calls multiplex over one connection per host.
+
+    Returns:
+        httpx.AsyncClient with keep-alive connection pooling
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        # Fail fast on unreachable hosts, the overall timeout covers slow responses
+        timeout=httpx.Timeout(settings.http_client_timeout, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=32,
+            keepalive_expiry=300,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the global HTTP client.
+
+    This client is shared across all requests and jobs in the process
+    and should not be closed by callers.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+
+    return _http_client
+
+
+async def warm_http_client() -> None:
+    """
+    Open keep-alive connections to the external hosts used by agent tools.
+
+    Failures are ignored: warming is an optimization, the hosts are
+    contacted again on demand by the tools themselves.
+    """
+    client = get_http_client()
+
+    results = await asyncio.gather(
+        *(client.head(url, timeout=5.0) for url in WARMUP_URLS),
+        return_exceptions=True,
+    )
+
+    warmed = sum(1 for result in results if not isinstance(result, Exception))
+    logger.info(f"HTTP client warmed ({warmed}/{len(WARMUP_URLS)} hosts connected)")
+
+
+async def close_http_client() -> None:
+    """
+    Close the global HTTP client.
+
+    Should only be called during application shutdown.
+    """
+    global _http_client
+
+    if _http_client is not None:
+        logger.info("Closing shared HTTP client")
+        await _http_client.aclose()
+        _http_client = None
@@ -101,8 +101,8 @@ class KnowledgeBaseChunk(Base):
     __table_args__ = (
         Index("idx_kb_chunks_document", "document_id"),
         Index("idx_kb_chunks_page", "page_number"),
-        # IVFFlat index for vector similarity search - created manually after table creation
-        # CREATE INDEX idx_kb_chunks_embedding ON knowledge_base_chunks USING ivfflat (embedding vector_cosine_ops);
+        # HNSW index for vector similarity search: see HNSW_INDEXES in database.py,
+        # built by scripts/create_vector_indexes.py
     )
 
     def __repr__(self):
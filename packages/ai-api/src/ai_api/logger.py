@@ -1,10 +1,26 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
+# Records are enqueued by a QueueHandler and written to stdout by a listener
+# thread, so slow log I/O never blocks the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
 
+_listener = logging.handlers.QueueListener(_log_queue, _stream_handler, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
+# The queue handler only merges args into the message; layout is applied by _stream_handler
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+
 logger = logging.getLogger("ai-api")
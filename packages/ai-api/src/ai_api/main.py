@@ -1,11 +1,10 @@
+import asyncio
 import base64
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from io import BytesIO
 from pathlib import Path
 
-import httpx
 from fastapi import (
     BackgroundTasks,
     Depends,
@@ -32,6 +31,7 @@ from .database import (
     save_message,
 )
 from .embeddings import create_embedding_service
+from .http_client import close_http_client, get_http_client, warm_http_client
 from .kb_models import KnowledgeBaseDocument
 from .logger import logger
 from .processing import process_pdf_document
@@ -55,9 +55,9 @@ from .schemas import (
 from .streams.manager import add_message_to_stream
 from .transcription import create_groq_client, transcribe_audio, validate_audio_file
 from .tts import (
+    TTS_VOICES,
     create_genai_client,
     get_audio_mimetype,
-    get_voice_for_language,
     pcm_to_audio,
     synthesize_speech,
     validate_text_input,
@@ -81,6 +81,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Failed to initialize Redis: {e}")
         raise
 
+    # Open keep-alive connections to hosts used by agent tools in the background,
+    # readiness shouldn't wait on third-party hosts
+    warm_task = asyncio.create_task(warm_http_client())
+
     logger.info("=" * 60)
     logger.info("AI API is ready!")
     logger.info("=" * 60)
@@ -98,6 +102,8 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down AI API service...")
     await close_arq_redis()
     logger.info("✅ Redis connection pool closed")
+    warm_task.cancel()
+    await close_http_client()
 
 
 app = FastAPI(
@@ -1112,28 +1118,28 @@ async def chat(request: ChatRequest, db: Session = Depends(get_db)):
         # Initialize embedding service following Pydantic AI best practices
         embedding_service = create_embedding_service(settings.gemini_api_key)
 
-        # Initialize HTTP client and WhatsApp client for agent tools
-        async with httpx.AsyncClient(timeout=settings.whatsapp_client_timeout) as http_client:
-            whatsapp_client = create_whatsapp_client(
-                http_client=http_client,
-                base_url=settings.whatsapp_client_url,
-            )
+        # Initialize WhatsApp client for agent tools on the shared HTTP client
+        http_client = get_http_client()
+        whatsapp_client = create_whatsapp_client(
+            http_client=http_client,
+            base_url=settings.whatsapp_client_url,
+        )
 
-            agent_deps = AgentDeps(
-                db=db,
-                user_id=str(user.id),
-                whatsapp_jid=request.whatsapp_jid,
-                recent_message_ids=[str(msg.id) for msg in history] if history else [],
-                embedding_service=embedding_service,
-                http_client=http_client,
-                whatsapp_client=whatsapp_client,
-                current_message_id=request.whatsapp_message_id,
-            )
+        agent_deps = AgentDeps(
+            db=db,
+            user_id=str(user.id),
+            whatsapp_jid=request.whatsapp_jid,
+            recent_message_ids=[str(msg.id) for msg in history] if history else [],
+            embedding_service=embedding_service,
+            http_client=http_client,
+            whatsapp_client=whatsapp_client,
+            current_message_id=request.whatsapp_message_id,
+        )
 
-            # Get AI response (using formatted content) - consume stream into complete response
-            ai_response = ""
-            async for token in get_ai_response(content, message_history, agent_deps=agent_deps):
-                ai_response += token
+        # Get AI response (using formatted content) - consume stream into complete response
+        ai_response = ""
+        async for token in get_ai_response(content, message_history, agent_deps=agent_deps):
+            ai_response += token
 
         # Generate embedding for assistant response using embedding service
         assistant_embedding = None
@@ -1200,9 +1206,10 @@ async def transcribe_audio_endpoint(
     logger.info("Received audio transcription request")
 
     try:
-        # Step 1: Read and validate audio file
-        audio_content = await file.read()
-        file_size = len(audio_content)
+        # Step 1: Validate audio file (size from the spooled upload, no full read)
+        file.file.seek(0, 2)
+        file_size = file.file.tell()
+        file.file.seek(0)
 
         is_valid, error_msg, file_format = validate_audio_file(
             file.filename or "unknown", file.content_type, file_size
@@ -1233,10 +1240,9 @@ async def transcribe_audio_endpoint(
             )
 
         # Step 4: Transcribe audio
-        audio_file_obj = BytesIO(audio_content)
         transcription_text, transcription_error = await transcribe_audio(
             groq_client,
-            audio_file_obj,
+            file.file,
             file.filename or f"audio.{file_format}",
             language=effective_language,
         )
@@ -1304,7 +1310,7 @@ async def text_to_speech_endpoint(request: TTSRequest, db: Session = Depends(get
         if request.whatsapp_jid:
             prefs = get_user_preferences(db, request.whatsapp_jid)
             if prefs:
-                voice = get_voice_for_language(prefs.tts_language)
+                voice = TTS_VOICES.get(prefs.tts_language, settings.tts_default_voice)
                 logger.info(f"Using voice '{voice}' for language '{prefs.tts_language}'")
 
         # Step 3: Create Gemini client
@@ -1323,7 +1329,7 @@ async def text_to_speech_endpoint(request: TTSRequest, db: Session = Depends(get
 
         # Step 5: Convert PCM to requested format
         output_format = request.format
-        audio_data = pcm_to_audio(pcm_data, output_format)
+        audio_data = await pcm_to_audio(pcm_data, output_format)
         mimetype = get_audio_mimetype(output_format)
 
         logger.info(
@@ -0,0 +1,222 @@
+"""
+In-process Ogg/Opus encoding for TTS voice notes.
+
+Encodes raw 16-bit PCM with libopus (via opuslib) and writes the Ogg
+container directly (RFC 7845), avoiding an ffmpeg subprocess per response.
+
+libopus is a system library; when it's missing OPUS_AVAILABLE is False and
+callers fall back to pydub/ffmpeg.
+"""
+
+import struct
+import threading
+from functools import lru_cache
+
+from .logger import logger
+
+try:
+    import opuslib
+
+    OPUS_AVAILABLE = True
+except Exception as e:  # opuslib raises a bare Exception when libopus isn't found
+    opuslib = None
+    OPUS_AVAILABLE = False
+    logger.warning(f"libopus not available, OGG encoding will use ffmpeg: {e}")
+
+# Input rates libopus accepts
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+# Opus granule positions always count 48kHz samples
+GRANULE_RATE = 48000
+
+# Encoder lookahead (6.5ms at 48kHz) that decoders must skip, same for all input rates
+PRE_SKIP = 312
+
+FRAME_DURATION_MS = 20
+
+# Max lacing values per Ogg page
+MAX_PAGE_SEGMENTS = 255
+
+VENDOR = b"ai-api"
+
+# Ogg stream serial number (files hold a single logical stream)
+SERIAL = 1
+
+# Per-thread encoders, keyed by (rate, channels)
+_local = threading.local()
+
+
+def _build_crc_table() -> list[int]:
+    """Build the Ogg CRC-32 lookup table (poly 0x04C11DB7, no reflection)."""
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else (crc << 1)
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+_CRC_TABLE = _build_crc_table()
+
+
+def _ogg_crc(data: bytes) -> int:
+    """Compute the Ogg page checksum."""
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ _CRC_TABLE[(crc >> 24) ^ byte]
+    return crc
+
+
+def _ogg_page(
+    packets: list[bytes], granule: int, serial: int, sequence: int, header_type: int = 0
+) -> bytearray:
+    """
+    Build a single Ogg page holding complete packets.
+
+    Args:
+        packets: Packets to store (their lacing must fit in one page)
+        granule: Granule position after the last packet on the page
+        serial: Stream serial number
+        sequence: Page sequence number
+        header_type: 0x02 for first page, 0x04 for last page
+
+    Returns:
+        Page bytes with checksum
+    """
+    lacing = bytearray()
+    for packet in packets:
+        lacing.extend(b"\xff" * (len(packet) // 255))
+        lacing.append(len(packet) % 255)
+
+    # Assemble in place: header, lacing table, then packet payloads
+    page = bytearray(
+        struct.pack(
+            "<4sBBqIIIB", b"OggS", 0, header_type, granule, serial, sequence, 0, len(lacing)
+        )
+    )
+    page += lacing
+    for packet in packets:
+        page += packet
+    struct.pack_into("<I", page, 22, _ogg_crc(page))
+    return page
+
+
+def _lacing_size(packet: bytes) -> int:
+    """Number of lacing values a packet needs."""
+    return len(packet) // 255 + 1
+
+
+def _get_encoder(rate: int, channels: int) -> "opuslib.Encoder":
+    """
+    Get this thread's encoder for the given parameters, reset for a new stream.
+
+    Encoders keep state between frames, so they can't be shared across the
+    worker threads pcm_to_audio runs on, but they can be reused by one thread.
+
+    Args:
+        rate: Sample rate in Hz
+        channels: Number of audio channels
+
+    Returns:
+        Ready-to-use opuslib encoder
+    """
+    encoders = getattr(_local, "encoders", None)
+    if encoders is None:
+        encoders = _local.encoders = {}
+
+    encoder = encoders.get((rate, channels))
+    if encoder is None:
+        encoder = encoders[(rate, channels)] = opuslib.Encoder(rate, channels, "voip")
+    else:
+        encoder.reset_state()
+    return encoder
+
+
+@lru_cache(maxsize=8)
+def _header_pages(rate: int, channels: int) -> bytes:
+    """
+    Build the identification (BOS) and comment header pages.
+
+    They only depend on the stream parameters, so they're built once.
+
+    Args:
+        rate: Input sample rate in Hz
+        channels: Number of audio channels
+
+    Returns:
+        Both header pages, each on its own page as RFC 7845 requires
+    """
+    opus_head = struct.pack("<8sBBHIhB", b"OpusHead", 1, channels, PRE_SKIP, rate, 0, 0)
+    opus_tags = struct.pack("<8sI", b"OpusTags", len(VENDOR)) + VENDOR + struct.pack("<I", 0)
+    return bytes(
+        _ogg_page([opus_head], 0, SERIAL, 0, header_type=0x02)
+        + _ogg_page([opus_tags], 0, SERIAL, 1)
+    )
+
+
+def encode_ogg_opus(pcm_data: bytes, rate: int = 24000, channels: int = 1) -> bytes:
+    """
+    Encode 16-bit little-endian PCM to an Ogg/Opus file.
+
+    Pure function apart from the libopus call.
+
+    Args:
+        pcm_data: Raw PCM audio bytes (16-bit samples)
+        rate: Sample rate in Hz (one of OPUS_SAMPLE_RATES)
+        channels: Number of audio channels (1 or 2)
+
+    Returns:
+        Ogg/Opus audio bytes
+    """
+    encoder = _get_encoder(rate, channels)
+
+    frame_samples = rate * FRAME_DURATION_MS // 1000
+    frame_bytes = frame_samples * channels * 2
+    granule_per_frame = GRANULE_RATE * FRAME_DURATION_MS // 1000
+
+    pages = [_header_pages(rate, channels)]
+
+    # Audio packets. Frames are sliced from a memoryview and only copied at the
+    # ctypes boundary (opuslib casts its argument, so it needs bytes); the
+    # trailing partial frame is zero-padded in a preallocated buffer.
+    pcm_view = memoryview(pcm_data)
+    full_end = len(pcm_view) - len(pcm_view) % frame_bytes
+    packets = [
+        encoder.encode(bytes(pcm_view[start : start + frame_bytes]), frame_samples)
+        for start in range(0, full_end, frame_bytes)
+    ]
+    if full_end < len(pcm_view):
+        tail = bytearray(frame_bytes)
+        tail[: len(pcm_view) - full_end] = pcm_view[full_end:]
+        packets.append(encoder.encode(bytes(tail), frame_samples))
+
+    # Final granule excludes the padding so players trim it (RFC 7845 section 4.5)
+    total_samples = len(pcm_data) // (channels * 2)
+    end_granule = PRE_SKIP + total_samples * GRANULE_RATE // rate
+
+    # Flush the encoder lookahead: decoders drop the first PRE_SKIP samples, so
+    # keep feeding silence until the stream holds PRE_SKIP beyond the input
+    silence = bytes(frame_bytes)
+    while len(packets) * granule_per_frame < end_granule:
+        packets.append(encoder.encode(silence, frame_samples))
+
+    # Pack as many packets per page as the lacing table allows. A page's granule
+    # is the number of samples decoded once its last packet is (pre-skip included)
+    sequence = 2
+    granule = 0
+    page_packets: list[bytes] = []
+    segments = 0
+    for index, packet in enumerate(packets):
+        if page_packets and segments + _lacing_size(packet) > MAX_PAGE_SEGMENTS:
+            pages.append(_ogg_page(page_packets, granule, SERIAL, sequence))
+            sequence += 1
+            page_packets, segments = [], 0
+
+        page_packets.append(packet)
+        segments += _lacing_size(packet)
+        granule = (index + 1) * granule_per_frame
+
+    pages.append(_ogg_page(page_packets, end_granule, SERIAL, sequence, header_type=0x04))
+
+    return b"".join(pages)
@@ -8,10 +8,10 @@ This worker processes chat messages asynchronously by:
 4. Saving the complete response to PostgreSQL with embeddings
 """
 
+import asyncio
 import os
 from typing import Any
 
-import httpx
 from arq.connections import RedisSettings
 from redis.asyncio import Redis
 
@@ -19,6 +19,7 @@ from ..agent import AgentDeps, format_message_history, get_ai_response
 from ..config import settings
 from ..database import SessionLocal, get_conversation_history, save_message
 from ..embeddings import create_embedding_service
+from ..http_client import close_http_client, get_http_client, warm_http_client
 from ..logger import logger
 from ..whatsapp import WhatsAppClient, create_whatsapp_client
 from .utils import save_job_chunk, set_job_metadata
@@ -73,7 +74,6 @@ async def process_chat_job(
     db = SessionLocal()
     chunk_index = 0
     full_response = ""
-    http_client: httpx.AsyncClient | None = None
     whatsapp_client: WhatsAppClient | None = None
 
     try:
@@ -89,8 +89,8 @@ async def process_chat_job(
         logger.info(f"[Job {job_id}] Initializing embedding service...")
         embedding_service = create_embedding_service(os.getenv("GEMINI_API_KEY"))
 
-        # Step 2.5: Initialize HTTP client and WhatsApp client
-        http_client = httpx.AsyncClient(timeout=settings.whatsapp_client_timeout)
+        # Step 2.5: Initialize WhatsApp client on the shared HTTP client
+        http_client = get_http_client()
         whatsapp_client = create_whatsapp_client(
             http_client=http_client,
             base_url=settings.whatsapp_client_url,
@@ -192,14 +192,21 @@ async def process_chat_job(
         raise
 
     finally:
-        # Close HTTP client
-        if http_client:
-            await http_client.aclose()
-            logger.info(f"[Job {job_id}] HTTP client closed")
         db.close()
         logger.info(f"[Job {job_id}] Database session closed")
 
 
+async def startup(ctx: dict[str, Any]) -> None:
+    """Warm the shared HTTP client in the background, without holding up the first job."""
+    ctx["warm_task"] = asyncio.create_task(warm_http_client())
+
+
+async def shutdown(ctx: dict[str, Any]) -> None:
+    """Close the shared HTTP client."""
+    ctx["warm_task"].cancel()
+    await close_http_client()
+
+
 class WorkerSettings:
     """
     arq worker configuration.
@@ -218,6 +225,10 @@ class WorkerSettings:
     # Worker functions
     functions = [process_chat_job]
 
+    # Lifecycle hooks (shared HTTP client)
+    on_startup = startup
+    on_shutdown = shutdown
+
     # Job timeout (default 2 minutes, configurable)
     job_timeout = int(os.getenv("ARQ_JOB_TIMEOUT", "120"))
 
@@ -4,11 +4,13 @@ Conversation history RAG implementation.
 Provides semantic search over user's conversation history using vector similarity.
 """
 
+from datetime import datetime
+
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from ..config import settings
-from ..database import ConversationMessage
+from ..database import ConversationMessage, set_hnsw_search_params
 from ..logger import logger
 
 
@@ -65,6 +67,28 @@ def get_context_messages(
     }
 
 
+def _message_from_json(data: dict, user_id) -> ConversationMessage:
+    """
+    Build a (transient) ConversationMessage from a jsonb context row.
+
+    Args:
+        data: Message columns as decoded from jsonb
+        user_id: Owner of the message (same as the matched message)
+
+    Returns:
+        ConversationMessage with the fields used for formatting
+    """
+    return ConversationMessage(
+        id=data["id"],
+        user_id=user_id,
+        role=data["role"],
+        content=data["content"],
+        sender_jid=data["sender_jid"],
+        sender_name=data["sender_name"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
 async def search_conversation_history(
     db: Session,
     query_embedding: list[float],
@@ -124,7 +148,8 @@ async def search_conversation_history(
         "user_id": user_id,
         "embedding": query_embedding,
         "limit": limit,
-        "threshold": similarity_threshold,
+        "max_distance": 1 - similarity_threshold,
+        "context_window": max(context_window, 0) if include_context else 0,
     }
 
     if exclude_message_ids:
@@ -135,28 +160,64 @@ async def search_conversation_history(
     # Vector similarity query using cosine distance
     # pgvector uses <=> for cosine distance (lower = more similar)
     # We convert to similarity score: 1 - distance
-    # NOTE: Cast :embedding to vector type for pgvector compatibility
+    # NOTE: Both sides are cast to halfvec(3072) so the HNSW index
+    # (see database.HNSW_INDEXES) serves the ORDER BY ... LIMIT
+    #
+    # Context windows are fetched in the same round trip via LATERAL joins
+    # (same logic as get_context_messages), aggregated as jsonb arrays.
+    # The embedding column itself is not selected: it's ~12KB per row
+    # and nothing downstream needs it.
     query_sql = text(f"""
+        WITH matches AS (
+            SELECT
+                id,
+                user_id,
+                role,
+                content,
+                sender_jid,
+                sender_name,
+                timestamp,
+                embedding_generated_at,
+                (1 - (embedding::halfvec(3072) <=> CAST(:embedding AS halfvec(3072)))) AS similarity
+            FROM conversation_messages
+            WHERE user_id = :user_id
+              AND embedding IS NOT NULL
+              {exclude_clause}
+              AND (embedding::halfvec(3072) <=> CAST(:embedding AS halfvec(3072))) <= :max_distance
+            ORDER BY embedding::halfvec(3072) <=> CAST(:embedding AS halfvec(3072))
+            LIMIT :limit
+        )
         SELECT
-            id,
-            user_id,
-            role,
-            content,
-            sender_jid,
-            sender_name,
-            timestamp,
-            embedding,
-            embedding_generated_at,
-            (1 - (embedding <=> CAST(:embedding AS vector))) AS similarity
-        FROM conversation_messages
-        WHERE user_id = :user_id
-          AND embedding IS NOT NULL
-          {exclude_clause}
-          AND (1 - (embedding <=> CAST(:embedding AS vector))) >= :threshold
-        ORDER BY similarity DESC
-        LIMIT :limit
+            m.*,
+            ctx_before.messages AS messages_before,
+            ctx_after.messages AS messages_after
+        FROM matches m
+        CROSS JOIN LATERAL (
+            SELECT COALESCE(jsonb_agg(b ORDER BY b.timestamp), '[]'::jsonb) AS messages
+            FROM (
+                SELECT id, role, content, sender_jid, sender_name, timestamp
+                FROM conversation_messages
+                WHERE user_id = m.user_id
+                  AND timestamp < m.timestamp
+                ORDER BY timestamp DESC
+                LIMIT :context_window
+            ) b
+        ) ctx_before
+        CROSS JOIN LATERAL (
+            SELECT COALESCE(jsonb_agg(a ORDER BY a.timestamp), '[]'::jsonb) AS messages
+            FROM (
+                SELECT id, role, content, sender_jid, sender_name, timestamp
+                FROM conversation_messages
+                WHERE user_id = m.user_id
+                  AND timestamp > m.timestamp
+                ORDER BY timestamp ASC
+                LIMIT :context_window
+            ) a
+        ) ctx_after
+        ORDER BY m.similarity DESC
     """)
 
+    set_hnsw_search_params(db)
     result = db.execute(query_sql, params)
     rows = result.fetchall()
 
@@ -173,7 +234,6 @@ async def search_conversation_history(
             sender_jid=row.sender_jid,
             sender_name=row.sender_name,
             timestamp=row.timestamp,
-            embedding=row.embedding,
             embedding_generated_at=row.embedding_generated_at,
         )
         # Attach similarity score as metadata
@@ -181,28 +241,24 @@ async def search_conversation_history(
 
         logger.debug(f"  - [{row.role}] (similarity: {row.similarity:.3f})\n{row.content}")
 
+        # Empty when context is disabled (context_window = 0)
+        messages_before = [_message_from_json(m, row.user_id) for m in row.messages_before]
+        messages_after = [_message_from_json(m, row.user_id) for m in row.messages_after]
+
         if include_context and context_window > 0:
-            # Get surrounding context
-            context = get_context_messages(db, msg, context_window)
-            results.append(
-                {
-                    "messages_before": context["before"],
-                    "matched_message": msg,
-                    "messages_after": context["after"],
-                    "similarity_score": msg._similarity_score,
-                }
-            )
-        else:
-            # No context - return just the matched message (backward compatible)
-            results.append(
-                {
-                    "messages_before": [],
-                    "matched_message": msg,
-                    "messages_after": [],
-                    "similarity_score": msg._similarity_score,
-                }
+            logger.info(
+                f"Context window: {len(messages_before)} before, {len(messages_after)} after (window_size={context_window})"
             )
 
+        results.append(
+            {
+                "messages_before": messages_before,
+                "matched_message": msg,
+                "messages_after": messages_after,
+                "similarity_score": msg._similarity_score,
+            }
+        )
+
     return results
 
 
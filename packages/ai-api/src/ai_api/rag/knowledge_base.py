@@ -9,6 +9,7 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from ..config import settings
+from ..database import set_hnsw_search_params
 from ..logger import logger
 
 
@@ -56,6 +57,7 @@ async def search_knowledge_base(
     # JOIN with documents to get metadata and filter by status
     # pgvector uses <=> for cosine distance (lower = more similar)
     # We convert to similarity score: 1 - distance
+    # Both sides are cast to halfvec(3072) so the HNSW index serves the ORDER BY
     #
     # Conversation scope filtering:
     # - Global documents (whatsapp_jid IS NULL) are always included
@@ -77,23 +79,24 @@ async def search_knowledge_base(
             d.upload_date,
             d.doc_metadata as document_metadata,
             d.is_conversation_scoped,
-            (1 - (c.embedding <=> CAST(:embedding AS vector))) AS similarity
+            (1 - (c.embedding::halfvec(3072) <=> CAST(:embedding AS halfvec(3072)))) AS similarity
         FROM knowledge_base_chunks c
         JOIN knowledge_base_documents d ON c.document_id = d.id
         WHERE d.status = 'completed'
           AND c.embedding IS NOT NULL
-          AND (1 - (c.embedding <=> CAST(:embedding AS vector))) >= :threshold
+          AND (c.embedding::halfvec(3072) <=> CAST(:embedding AS halfvec(3072))) <= :max_distance
           AND (d.whatsapp_jid IS NULL OR d.whatsapp_jid = :whatsapp_jid)
           AND (d.expires_at IS NULL OR d.expires_at > NOW())
-        ORDER BY similarity DESC
+        ORDER BY c.embedding::halfvec(3072) <=> CAST(:embedding AS halfvec(3072))
         LIMIT :limit
     """)
 
+    set_hnsw_search_params(db)
     result = db.execute(
         query_sql,
         {
             "embedding": query_embedding,
-            "threshold": similarity_threshold,
+            "max_distance": 1 - similarity_threshold,
             "limit": limit,
             "whatsapp_jid": whatsapp_jid,
         },
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Upgrade the pgvector extension and build the HNSW vector indexes.
+
+HNSW builds over 3072-dim embeddings can take minutes on a populated database,
+so they run as an explicit one-off migration instead of during API startup.
+Run it after the first start and after upgrading the pgvector image:
+    uv run python -m ai_api.scripts.create_vector_indexes
+
+Indexes are built with CREATE INDEX CONCURRENTLY, so the API and workers can
+keep serving (with sequential scans) while it runs. A session advisory lock
+keeps two runs from racing each other.
+"""
+
+import sys
+
+from sqlalchemy import text
+
+from .. import kb_models  # noqa: F401  (registers knowledge_base_chunks on Base.metadata)
+from ..database import (
+    HNSW_INDEXES,
+    PGVECTOR_HALFVEC_VERSION,
+    Base,
+    engine,
+    get_pgvector_version,
+)
+from ..logger import logger
+
+# Arbitrary application-wide key for pg_advisory_lock
+VECTOR_INDEX_LOCK_KEY = 7_320_448_061
+
+
+def create_vector_indexes() -> bool:
+    """
+    Upgrade pgvector and create (or repair) every HNSW index in HNSW_INDEXES.
+
+    Returns:
+        False if pgvector is too old for halfvec indexes, True otherwise
+    """
+    # CONCURRENTLY can't run inside a transaction, hence autocommit
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        logger.info("Waiting for vector index migration lock...")
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": VECTOR_INDEX_LOCK_KEY})
+
+        try:
+            # Upgrade databases created with an older image to the installed library
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            conn.execute(text("ALTER EXTENSION vector UPDATE"))
+
+            version = get_pgvector_version(conn)
+            logger.info(f"pgvector extension version {'.'.join(map(str, version))}")
+            if version < PGVECTOR_HALFVEC_VERSION:
+                logger.error(
+                    f"pgvector {'.'.join(map(str, version))} is too old, semantic search needs "
+                    ">= 0.7 (use the pgvector/pgvector:0.8.1-pg16 image)"
+                )
+                return False
+
+            Base.metadata.create_all(bind=conn)
+
+            for table_name, index_name in HNSW_INDEXES.items():
+                _create_hnsw_index(conn, table_name, index_name)
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": VECTOR_INDEX_LOCK_KEY})
+
+    return True
+
+
+def _create_hnsw_index(conn, table_name: str, index_name: str) -> None:
+    """
+    Build one HNSW index, replacing an invalid leftover from an interrupted build.
+
+    Args:
+        conn: Autocommit database connection
+        table_name: Table holding the `embedding` column
+        index_name: Name of the HNSW index
+    """
+    # A concurrent build in progress also shows as invalid, leave it alone
+    # (e.g. started by hand, outside this script's advisory lock)
+    building = conn.execute(
+        text("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_stat_progress_create_index
+                WHERE index_relid = to_regclass(:name)
+            )
+        """),
+        {"name": index_name},
+    ).scalar()
+    if building:
+        logger.warning(f"HNSW index {index_name} is being built by another session, skipping")
+        return
+
+    # An interrupted concurrent build leaves an invalid index behind that
+    # IF NOT EXISTS would keep forever, drop it and rebuild
+    invalid = conn.execute(
+        text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": index_name},
+    ).scalar()
+    if invalid:
+        logger.warning(f"Rebuilding invalid HNSW index {index_name}")
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+
+    logger.info(f"Building HNSW index {index_name} on {table_name}...")
+    conn.execute(
+        text(f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name}
+            USING hnsw ((embedding::halfvec(3072)) halfvec_cosine_ops)
+            WITH (m = 24, ef_construction = 128)
+        """)
+    )
+    logger.info(f"HNSW index {index_name} ready")
+
+
+if __name__ == "__main__":
+    sys.exit(0 if create_vector_indexes() else 1)
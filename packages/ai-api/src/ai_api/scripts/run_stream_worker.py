@@ -11,7 +11,13 @@ import asyncio
 
 from redis.asyncio import Redis
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from ..config import settings
+from ..http_client import close_http_client, warm_http_client
 from ..logger import logger
 from ..streams.consumer import run_stream_consumer
 
@@ -26,12 +32,22 @@ async def main():
         decode_responses=False,
     )
 
+    # Open keep-alive connections to hosts used by agent tools, without
+    # holding up the first job
+    warm_task = asyncio.create_task(warm_http_client())
+
     try:
         await run_stream_consumer(redis)
     finally:
         await redis.close()
         logger.info("Redis connection closed")
+        warm_task.cancel()
+        await close_http_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop speeds up the socket I/O behind Redis, HTTP and WhatsApp calls
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -23,6 +23,11 @@ The worker will:
 from arq.worker import run_worker
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -47,6 +52,10 @@ def main():
     logger.info(f"Keep results: {WorkerSettings.keep_result}s")
     logger.info("=" * 80)
 
+    # arq runs on the current event loop, make that a uvloop one when available
+    if uvloop is not None:
+        uvloop.install()
+
     # Run the worker (blocks until shutdown signal)
     run_worker(WorkerSettings)
 
@@ -5,7 +5,6 @@ This processor can be called directly without arq job context,
 making it compatible with Redis Streams.
 """
 
-import httpx
 from redis.asyncio import Redis
 
 from ..agent import AgentDeps, format_message_history, get_ai_response
@@ -17,6 +16,7 @@ from ..database import (
     save_message,
 )
 from ..embeddings import create_embedding_service
+from ..http_client import get_http_client
 from ..logger import logger
 from ..processing import process_pdf_document
 from ..queue.connection import get_redis_client
@@ -90,7 +90,6 @@ async def process_chat_job_direct(
     db = SessionLocal()
     chunk_index = 0
     full_response = ""
-    http_client: httpx.AsyncClient | None = None
     whatsapp_client: WhatsAppClient | None = None
 
     try:
@@ -106,8 +105,8 @@ async def process_chat_job_direct(
         logger.info(f"[Job {job_id}] Initializing embedding service...")
         embedding_service = create_embedding_service(settings.gemini_api_key)
 
-        # Step 2.5: Initialize HTTP client and WhatsApp client
-        http_client = httpx.AsyncClient(timeout=settings.whatsapp_client_timeout)
+        # Step 2.5: Initialize WhatsApp client on the shared HTTP client
+        http_client = get_http_client()
         whatsapp_client = create_whatsapp_client(
             http_client=http_client,
             base_url=settings.whatsapp_client_url,
@@ -337,9 +336,5 @@ async def process_chat_job_direct(
         raise
 
     finally:
-        # Close HTTP client
-        if http_client:
-            await http_client.aclose()
-            logger.info(f"[Job {job_id}] HTTP client closed")
         db.close()
         logger.info(f"[Job {job_id}] Database session closed")
@@ -1,6 +1,7 @@
 """Shared dependencies for agent tools."""
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 
 import httpx
 from sqlalchemy.orm import Session
@@ -26,3 +27,5 @@ class AgentDeps:
     http_client: httpx.AsyncClient | None = None
     whatsapp_client: WhatsAppClient | None = None
     current_message_id: str | None = None
+    # Recent ((tool_name, query), result) pairs, lets tools skip repeated identical calls
+    recent_tool_results: deque = field(default_factory=lambda: deque(maxlen=4))
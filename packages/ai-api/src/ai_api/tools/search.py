@@ -1,5 +1,7 @@
 """Search tools - conversation history and knowledge base search."""
 
+import logging
+
 from pydantic_ai import Agent, RunContext
 
 from ..logger import logger
@@ -9,6 +11,17 @@ from ..rag.knowledge_base import format_knowledge_base_results
 from ..rag.knowledge_base import search_knowledge_base as search_kb_fn
 from .deps import AgentDeps
 
+# Separator line for tool call logging
+_BANNER = "=" * 80
+
+
+def _get_recent_result(deps: AgentDeps, key: tuple[str, str]) -> str | None:
+    """Return the result of an identical recent tool call, if one is stored."""
+    for recent_key, result in deps.recent_tool_results:
+        if recent_key == key:
+            return result
+    return None
+
 
 def register_search_tools(agent: Agent) -> None:
     """Register search tools on the given agent."""
@@ -28,14 +41,25 @@ def register_search_tools(agent: Agent) -> None:
         Returns:
             Formatted string with relevant past messages or error message
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("🔍 TOOL CALLED: search_conversation_history")
         logger.info(f"   Query: '{search_query}'")
         logger.info(f"   User ID: {ctx.deps.user_id}")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         deps = ctx.deps
 
+        query = search_query.strip()
+        if not query:
+            return "Search query is empty. Please provide a topic to search for."
+
+        # Agent retry loops often repeat the same call; reuse the previous result
+        cache_key = ("search_conversation_history", query)
+        recent_result = _get_recent_result(deps, cache_key)
+        if recent_result is not None:
+            logger.info("Reusing result of identical recent conversation search")
+            return recent_result
+
         # Check if semantic search dependencies are available
         if not deps.embedding_service:
             return (
@@ -47,7 +71,7 @@ def register_search_tools(agent: Agent) -> None:
         try:
             # Generate query embedding using injected service
             query_embedding = await deps.embedding_service.generate(
-                search_query,
+                query,
                 task_type="RETRIEVAL_QUERY",
             )
 
@@ -59,45 +83,49 @@ def register_search_tools(agent: Agent) -> None:
                 db=deps.db,
                 query_embedding=query_embedding,
                 user_id=deps.user_id,
-                query_text=search_query,
+                query_text=query,
                 exclude_message_ids=deps.recent_message_ids,
             )
 
             if not messages:
                 logger.info("No relevant past messages found.")
-                return (
-                    f"No relevant past messages found for: {search_query}. "
+                no_results = (
+                    f"No relevant past messages found for: {query}. "
                     "Either we haven't discussed this topic, or messages are too old/dissimilar."
                 )
+                deps.recent_tool_results.append((cache_key, no_results))
+                return no_results
 
-            logger.info(f"Found {len(messages)} relevant past messages for query: '{search_query}'")
+            logger.info(f"Found {len(messages)} relevant past messages for query: '{query}'")
 
             # Format results with context using pure function
             formatted_results = format_conversation_results(messages)
 
-            # Log detailed results for debugging
-            logger.info(f"Conversation RAG returned {len(messages)} results:")
-            for i, msg in enumerate(messages, 1):
-                logger.info(f"  [{i}] Similarity: {msg.get('similarity_score', 'N/A'):.3f}")
-                logger.info(f"      Full content: {msg['matched_message'].content}")
-
             logger.info(f"Formatted results length: {len(formatted_results)} characters")
-            logger.info(f"Full formatted results:\n{formatted_results}")
 
-            logger.info("=" * 80)
+            # Full content dumps can be several KB per result, only build them for DEBUG
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Conversation RAG returned {len(messages)} results:")
+                for i, msg in enumerate(messages, 1):
+                    logger.debug(f"  [{i}] Similarity: {msg.get('similarity_score', 'N/A'):.3f}")
+                    logger.debug(f"      Full content: {msg['matched_message'].content}")
+                logger.debug(f"Full formatted results:\n{formatted_results}")
+
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: search_conversation_history")
             logger.info(f"   Returning {len(formatted_results)} characters to agent")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
+            deps.recent_tool_results.append((cache_key, formatted_results))
             return formatted_results
 
         except Exception as e:
             logger.error(f"Error in semantic search: {str(e)}", exc_info=True)
             error_msg = f"Error searching conversation history: {str(e)}"
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: search_conversation_history")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return error_msg
 
     @agent.tool
@@ -120,13 +148,24 @@ def register_search_tools(agent: Agent) -> None:
         Returns:
             Formatted string with relevant document passages and citations
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("📚 TOOL CALLED: search_knowledge_base")
         logger.info(f"   Query: '{search_query}'")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         deps = ctx.deps
 
+        query = search_query.strip()
+        if not query:
+            return "Search query is empty. Please provide a topic to search for."
+
+        # Agent retry loops often repeat the same call; reuse the previous result
+        cache_key = ("search_knowledge_base", query)
+        recent_result = _get_recent_result(deps, cache_key)
+        if recent_result is not None:
+            logger.info("Reusing result of identical recent knowledge base search")
+            return recent_result
+
         # Check if knowledge base dependencies are available
         if not deps.embedding_service:
             return (
@@ -137,7 +176,7 @@ def register_search_tools(agent: Agent) -> None:
         try:
             # Generate query embedding
             query_embedding = await deps.embedding_service.generate(
-                search_query,
+                query,
                 task_type="RETRIEVAL_QUERY",
             )
 
@@ -149,51 +188,55 @@ def register_search_tools(agent: Agent) -> None:
             results = await search_kb_fn(
                 db=deps.db,
                 query_embedding=query_embedding,
-                query_text=search_query,
+                query_text=query,
                 whatsapp_jid=deps.whatsapp_jid,
             )
 
             if not results:
                 logger.info("No relevant documents found in knowledge base")
-                return (
-                    f"No relevant information found in the knowledge base for: {search_query}. "
+                no_results = (
+                    f"No relevant information found in the knowledge base for: {query}. "
                     "This topic may not be covered in uploaded documents."
                 )
+                deps.recent_tool_results.append((cache_key, no_results))
+                return no_results
 
             logger.info(f"Found {len(results)} relevant passages from knowledge base")
 
             # Format results with citations using pure function
             formatted_results = format_knowledge_base_results(results)
 
-            # Log detailed results for debugging
-            logger.info(f"Knowledge Base RAG returned {len(results)} results:")
-            for i, result in enumerate(results, 1):
-                chunk = result["chunk"]
-                doc = result["document"]
-                similarity = result["similarity_score"]
-                logger.info(
-                    f"  [{i}] Document: {doc['original_filename']} | "
-                    f"Similarity: {similarity:.3f} | "
-                    f"Page: {chunk.get('page_number', 'N/A')} | "
-                    f"Tokens: {chunk.get('token_count', 'N/A')}"
-                )
-                logger.info(f"      Raw content (before cleaning):\n{chunk['content']}")
-
             logger.info(f"Formatted results length: {len(formatted_results)} characters")
-            logger.info(f"Full formatted results (after cleaning):\n{formatted_results}")
 
-            logger.info("=" * 80)
+            # Full content dumps can be several KB per result, only build them for DEBUG
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Knowledge Base RAG returned {len(results)} results:")
+                for i, result in enumerate(results, 1):
+                    chunk = result["chunk"]
+                    doc = result["document"]
+                    similarity = result["similarity_score"]
+                    logger.debug(
+                        f"  [{i}] Document: {doc['original_filename']} | "
+                        f"Similarity: {similarity:.3f} | "
+                        f"Page: {chunk.get('page_number', 'N/A')} | "
+                        f"Tokens: {chunk.get('token_count', 'N/A')}"
+                    )
+                    logger.debug(f"      Raw content (before cleaning):\n{chunk['content']}")
+                logger.debug(f"Full formatted results (after cleaning):\n{formatted_results}")
+
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: search_knowledge_base")
             logger.info(f"   Returning {len(formatted_results)} characters to agent")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
+            deps.recent_tool_results.append((cache_key, formatted_results))
             return formatted_results
 
         except Exception as e:
             logger.error(f"Error in knowledge base search: {str(e)}", exc_info=True)
             error_msg = f"Error searching knowledge base: {str(e)}"
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: search_knowledge_base")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return error_msg
@@ -2,6 +2,7 @@
 
 import asyncio
 
+import orjson
 import pint
 import wikipediaapi
 from pydantic_ai import Agent, RunContext
@@ -13,6 +14,9 @@ from .deps import AgentDeps
 # Unit registry for conversions (created once at module load)
 ureg = pint.UnitRegistry()
 
+# Separator line for tool call logging
+_BANNER = "=" * 80
+
 
 def register_utility_tools(agent: Agent) -> None:
     """Register utility tools on the given agent."""
@@ -36,27 +40,27 @@ def register_utility_tools(agent: Agent) -> None:
         Returns:
             Result of the calculation or error message
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("🧮 TOOL CALLED: calculate")
         logger.info(f"   Expression: '{expression}'")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             result = simple_eval(expression)
 
             logger.info(f"Calculation result: {result}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: calculate")
             logger.info(f"   Result: {result}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return f"{expression} = {result}"
         except Exception as e:
             logger.error(f"Calculation failed: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: calculate")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return f"Could not calculate: {str(e)}"
 
     @agent.tool
@@ -73,10 +77,10 @@ def register_utility_tools(agent: Agent) -> None:
         Returns:
             Current weather conditions including temperature, wind, humidity
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("🌤️ TOOL CALLED: get_weather")
         logger.info(f"   City: '{city}'")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         if not ctx.deps.http_client:
             return "HTTP client not available."
@@ -85,7 +89,7 @@ def register_utility_tools(agent: Agent) -> None:
             # Step 1: Geocode city name to coordinates
             geo_url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1"
             geo_resp = await ctx.deps.http_client.get(geo_url, timeout=10.0)
-            geo_data = geo_resp.json()
+            geo_data = orjson.loads(geo_resp.content)
 
             if not geo_data.get("results"):
                 logger.info(f"City '{city}' not found")
@@ -105,7 +109,7 @@ def register_utility_tools(agent: Agent) -> None:
                 f"current=temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m"
             )
             weather_resp = await ctx.deps.http_client.get(weather_url, timeout=10.0)
-            weather_data = weather_resp.json()
+            weather_data = orjson.loads(weather_resp.content)
 
             current = weather_data["current"]
             temp = current["temperature_2m"]
@@ -148,18 +152,18 @@ def register_utility_tools(agent: Agent) -> None:
             )
 
             logger.info(f"Weather retrieved: {temp}°C, {condition}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: get_weather")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return result
 
         except Exception as e:
             logger.error(f"Weather lookup failed: {str(e)}", exc_info=True)
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: get_weather")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return f"Could not get weather: {str(e)}"
 
     @agent.tool
@@ -181,10 +185,10 @@ def register_utility_tools(agent: Agent) -> None:
         Returns:
             Summary from Wikipedia or not found message
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("📖 TOOL CALLED: wikipedia_lookup")
         logger.info(f"   Topic: '{topic}'")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Run sync wikipedia-api in executor
@@ -216,19 +220,19 @@ def register_utility_tools(agent: Agent) -> None:
             formatted = f"**{result['title']}**\n\n{result['summary']}\n\nSource: {result['url']}"
 
             logger.info(f"Wikipedia article found: {result['title']}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: wikipedia_lookup")
             logger.info(f"   Returning {len(formatted)} characters to agent")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return formatted
 
         except Exception as e:
             logger.error(f"Wikipedia lookup failed: {str(e)}", exc_info=True)
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: wikipedia_lookup")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return f"Wikipedia lookup failed: {str(e)}"
 
     @agent.tool
@@ -260,10 +264,10 @@ def register_utility_tools(agent: Agent) -> None:
         Returns:
             Converted value with units
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("🔄 TOOL CALLED: convert_units")
         logger.info(f"   Value: {value} {from_unit} -> {to_unit}")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Run sync pint in executor (it's CPU-bound parsing)
@@ -276,9 +280,9 @@ def register_utility_tools(agent: Agent) -> None:
             result = await loop.run_in_executor(None, _convert)
 
             logger.info(f"Conversion result: {result}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: convert_units")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return result
 
@@ -292,8 +296,8 @@ def register_utility_tools(agent: Agent) -> None:
             return error_msg
         except Exception as e:
             logger.error(f"Conversion failed: {str(e)}", exc_info=True)
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: convert_units")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return f"Conversion failed: {str(e)}"
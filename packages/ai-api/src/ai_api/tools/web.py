@@ -10,6 +10,9 @@ from ..config import settings
 from ..logger import logger
 from .deps import AgentDeps
 
+# Separator line for tool call logging
+_BANNER = "=" * 80
+
 
 def register_web_tools(agent: Agent) -> None:
     """Register web tools on the given agent."""
@@ -35,10 +38,10 @@ def register_web_tools(agent: Agent) -> None:
         Returns:
             Formatted search results with titles, snippets, and source URLs
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("🌐 TOOL CALLED: web_search")
         logger.info(f"   Query: '{query}'")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # DDGS is sync-only, run in executor to not block event loop
@@ -60,19 +63,19 @@ def register_web_tools(agent: Agent) -> None:
             result_text = "\n\n".join(formatted)
 
             logger.info(f"Found {len(results)} search results")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: web_search")
             logger.info(f"   Returning {len(result_text)} characters to agent")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return result_text
 
         except Exception as e:
             logger.error(f"Web search failed: {str(e)}", exc_info=True)
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: web_search")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return f"Search failed: {str(e)}"
 
     @agent.tool
@@ -94,10 +97,10 @@ def register_web_tools(agent: Agent) -> None:
         Returns:
             Page content as clean markdown, or error message
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("📄 TOOL CALLED: fetch_website")
         logger.info(f"   URL: '{url}'")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         if not ctx.deps.http_client:
             return "HTTP client not available."
@@ -121,10 +124,10 @@ def register_web_tools(agent: Agent) -> None:
                 content = content[:8000] + "\n\n[Content truncated...]"
 
             logger.info(f"Fetched {len(content)} characters from URL")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("✅ TOOL RETURNING: fetch_website")
             logger.info(f"   Returning {len(content)} characters to agent")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return content
 
@@ -138,8 +141,8 @@ def register_web_tools(agent: Agent) -> None:
             return error_msg
         except Exception as e:
             logger.error(f"Failed to fetch URL: {str(e)}", exc_info=True)
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("❌ TOOL ERROR: fetch_website")
             logger.info(f"   Error: {str(e)}")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             return f"Failed to fetch URL: {str(e)}"
@@ -31,12 +31,12 @@ def register_whatsapp_tools(agent: Agent) -> None:
         Returns:
             Success message or error description
         """
-        logger.info("=" * 80)
-        logger.info("💬 TOOL CALLED: send_whatsapp_reaction")
-        logger.info(f"   Emoji: {emoji}")
-        logger.info(f"   JID: {ctx.deps.whatsapp_jid}")
-        logger.info(f"   Message ID: {ctx.deps.current_message_id}")
-        logger.info("=" * 80)
+        logger.debug(
+            "💬 TOOL CALLED: send_whatsapp_reaction emoji=%s jid=%s message_id=%s",
+            emoji,
+            ctx.deps.whatsapp_jid,
+            ctx.deps.current_message_id,
+        )
 
         deps = ctx.deps
 
@@ -53,7 +53,7 @@ def register_whatsapp_tools(agent: Agent) -> None:
                 emoji=emoji,
             )
 
-            logger.info(f"✅ Reaction {emoji} sent successfully")
+            logger.info("✅ Reaction %s sent successfully", emoji)
             return f"Reaction {emoji} sent successfully."
 
         except Exception as e:
@@ -84,13 +84,14 @@ def register_whatsapp_tools(agent: Agent) -> None:
         Returns:
             Success message or error description
         """
-        logger.info("=" * 80)
-        logger.info("📍 TOOL CALLED: send_whatsapp_location")
-        logger.info(f"   Coordinates: {latitude}, {longitude}")
-        logger.info(f"   Name: {name}")
-        logger.info(f"   Address: {address}")
-        logger.info(f"   JID: {ctx.deps.whatsapp_jid}")
-        logger.info("=" * 80)
+        logger.debug(
+            "📍 TOOL CALLED: send_whatsapp_location coords=%s,%s name=%s address=%s jid=%s",
+            latitude,
+            longitude,
+            name,
+            address,
+            ctx.deps.whatsapp_jid,
+        )
 
         deps = ctx.deps
 
@@ -113,7 +114,7 @@ def register_whatsapp_tools(agent: Agent) -> None:
             )
 
             location_desc = name or f"{latitude}, {longitude}"
-            logger.info(f"✅ Location '{location_desc}' sent successfully")
+            logger.info("✅ Location '%s' sent successfully", location_desc)
             return f"Location '{location_desc}' sent successfully."
 
         except Exception as e:
@@ -144,13 +145,14 @@ def register_whatsapp_tools(agent: Agent) -> None:
         Returns:
             Success message or error description
         """
-        logger.info("=" * 80)
-        logger.info("👤 TOOL CALLED: send_whatsapp_contact")
-        logger.info(f"   Contact: {contact_name} ({contact_phone})")
-        logger.info(f"   Email: {contact_email}")
-        logger.info(f"   Organization: {contact_organization}")
-        logger.info(f"   JID: {ctx.deps.whatsapp_jid}")
-        logger.info("=" * 80)
+        logger.debug(
+            "👤 TOOL CALLED: send_whatsapp_contact contact=%s (%s) email=%s org=%s jid=%s",
+            contact_name,
+            contact_phone,
+            contact_email,
+            contact_organization,
+            ctx.deps.whatsapp_jid,
+        )
 
         deps = ctx.deps
 
@@ -166,7 +168,7 @@ def register_whatsapp_tools(agent: Agent) -> None:
                 contact_org=contact_organization,
             )
 
-            logger.info(f"✅ Contact '{contact_name}' sent successfully")
+            logger.info("✅ Contact '%s' sent successfully", contact_name)
             return f"Contact card for '{contact_name}' sent successfully."
 
         except Exception as e:
@@ -192,11 +194,11 @@ def register_whatsapp_tools(agent: Agent) -> None:
         Returns:
             Success message or error description
         """
-        logger.info("=" * 80)
-        logger.info("📝 TOOL CALLED: send_whatsapp_message")
-        logger.info(f"   Text: {text[:100]}...")
-        logger.info(f"   JID: {ctx.deps.whatsapp_jid}")
-        logger.info("=" * 80)
+        logger.debug(
+            "📝 TOOL CALLED: send_whatsapp_message text=%.100s... jid=%s",
+            text,
+            ctx.deps.whatsapp_jid,
+        )
 
         deps = ctx.deps
 
@@ -212,7 +214,7 @@ def register_whatsapp_tools(agent: Agent) -> None:
                 text=text,
             )
 
-            logger.info(f"✅ Message sent successfully (ID: {result.message_id})")
+            logger.info("✅ Message sent successfully (ID: %s)", result.message_id)
             return "Message sent successfully."
 
         except Exception as e:
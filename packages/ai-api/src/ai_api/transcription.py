@@ -12,28 +12,35 @@ Pattern mirrors embeddings.py for consistency.
 
 from typing import BinaryIO
 
-from groq import Groq
+from groq import AsyncGroq
 
 from .config import settings
 from .logger import logger
 
 # Derived constants from settings
 MAX_FILE_SIZE_BYTES = settings.stt_max_file_size_mb * 1024 * 1024
-SUPPORTED_FORMATS = settings.stt_supported_formats.split(",")
+SUPPORTED_FORMATS = frozenset(
+    fmt.strip().lower() for fmt in settings.stt_supported_formats.split(",") if fmt.strip()
+)
 
 # MIME type mappings for validation
 AUDIO_MIME_TYPES = {
-    "mp3": ["audio/mpeg", "audio/mp3"],
-    "mp4": ["audio/mp4", "audio/x-m4a"],
-    "mpeg": ["audio/mpeg"],
-    "mpga": ["audio/mpeg"],
-    "m4a": ["audio/mp4", "audio/x-m4a", "audio/m4a"],
-    "wav": ["audio/wav", "audio/x-wav", "audio/wave"],
-    "webm": ["audio/webm"],
-    "ogg": ["audio/ogg", "audio/opus"],
-    "flac": ["audio/flac", "audio/x-flac"],
+    "mp3": frozenset({"audio/mpeg", "audio/mp3"}),
+    "mp4": frozenset({"audio/mp4", "audio/x-m4a"}),
+    "mpeg": frozenset({"audio/mpeg"}),
+    "mpga": frozenset({"audio/mpeg"}),
+    "m4a": frozenset({"audio/mp4", "audio/x-m4a", "audio/m4a"}),
+    "wav": frozenset({"audio/wav", "audio/x-wav", "audio/wave"}),
+    "webm": frozenset({"audio/webm"}),
+    "ogg": frozenset({"audio/ogg", "audio/opus"}),
+    "flac": frozenset({"audio/flac", "audio/x-flac"}),
 }
 
+# Error returned for unsupported extensions (formats are fixed at startup)
+_UNSUPPORTED_ERR = (
+    f"Unsupported or missing file extension. Supported: {', '.join(sorted(SUPPORTED_FORMATS))}"
+)
+
 
 def validate_audio_file(
     filename: str, content_type: str | None, file_size: int
@@ -54,6 +61,18 @@ def validate_audio_file(
         - error_message: Human-readable error if invalid, None otherwise
         - file_format: Detected format extension (e.g., "mp3"), None if invalid
     """
+    # Extract format from filename (cheap string checks first)
+    file_format = None
+    _, dot, extension = filename.rpartition(".")
+    if dot:
+        extension = extension.lower()
+        if extension in SUPPORTED_FORMATS:
+            file_format = extension
+
+    # Validate format
+    if not file_format:
+        return False, _UNSUPPORTED_ERR, None
+
     # Check file size
     if file_size == 0:
         return False, "Audio file is empty", None
@@ -66,39 +85,24 @@ def validate_audio_file(
             None,
         )
 
-    # Extract format from filename
-    file_format = None
-    if "." in filename:
-        extension = filename.rsplit(".", 1)[1].lower()
-        if extension in SUPPORTED_FORMATS:
-            file_format = extension
-
-    # Validate format
-    if not file_format:
-        return (
-            False,
-            f"Unsupported or missing file extension. Supported: {', '.join(SUPPORTED_FORMATS)}",
-            None,
-        )
-
     # Validate MIME type if provided
     if content_type:
         # Normalize MIME type (remove parameters like "; codecs=opus")
-        normalized_mime = content_type.split(";")[0].strip().lower()
+        normalized_mime = content_type.partition(";")[0].strip().lower()
 
         # Check if MIME type matches the file extension
-        expected_mimes = AUDIO_MIME_TYPES.get(file_format, [])
+        expected_mimes = AUDIO_MIME_TYPES.get(file_format, frozenset())
         if normalized_mime not in expected_mimes:
             logger.warning(
                 f"MIME type mismatch: file '{filename}' has type '{normalized_mime}', "
-                f"expected one of {expected_mimes}. Proceeding anyway."
+                f"expected one of {sorted(expected_mimes)}. Proceeding anyway."
             )
 
     logger.debug(f"Audio file validated: {filename} ({file_size} bytes, format: {file_format})")
     return True, None, file_format
 
 
-def create_groq_client(api_key: str | None) -> Groq | None:
+def create_groq_client(api_key: str | None) -> AsyncGroq | None:
     """
     Create Groq client from API key.
 
@@ -109,14 +113,14 @@ def create_groq_client(api_key: str | None) -> Groq | None:
         api_key: Groq API key
 
     Returns:
-        Groq client instance or None if API key not provided
+        Async Groq client instance or None if API key not provided
     """
     if not api_key:
         logger.warning("GROQ_API_KEY not set - speech-to-text will be disabled")
         return None
 
     try:
-        client = Groq(api_key=api_key)
+        client = AsyncGroq(api_key=api_key)
         logger.info(f"Groq client initialized (model: {settings.stt_model})")
         return client
     except Exception as e:
@@ -125,7 +129,7 @@ def create_groq_client(api_key: str | None) -> Groq | None:
 
 
 async def transcribe_audio(
-    client: Groq, audio_file: BinaryIO, filename: str, language: str | None = None
+    client: AsyncGroq, audio_file: BinaryIO, filename: str, language: str | None = None
 ) -> tuple[str | None, str | None]:
     """
     Transcribe audio file using Groq's Whisper API.
@@ -146,12 +150,14 @@ async def transcribe_audio(
     """
     try:
         # Prepare transcription request
-        # Read file content into memory for API call
-        audio_content = audio_file.read()
+        # Measure size without reading the file into memory
+        audio_file.seek(0, 2)
+        file_size = audio_file.tell()
+        audio_file.seek(0)
 
-        # Build parameters
+        # Build parameters (the SDK streams the file object into the multipart body)
         params = {
-            "file": (filename, audio_content),
+            "file": (filename, audio_file),
             "model": settings.stt_model,
             "response_format": "json",  # Simple JSON with just text
             "temperature": 0.0,  # Deterministic output
@@ -163,10 +169,8 @@ async def transcribe_audio(
             logger.debug(f"Transcribing with language hint: {language}")
 
         # Call Groq Whisper API
-        logger.info(
-            f"Transcribing audio with {settings.stt_model} (size: {len(audio_content)} bytes)"
-        )
-        transcription = client.audio.transcriptions.create(**params)
+        logger.info(f"Transcribing audio with {settings.stt_model} (size: {file_size} bytes)")
+        transcription = await client.audio.transcriptions.create(**params)
 
         # Extract text from response
         transcription_text = transcription.text.strip()
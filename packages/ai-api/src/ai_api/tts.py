@@ -10,7 +10,10 @@ Follows functional programming style with pure functions for:
 Pattern mirrors transcription.py for consistency.
 """
 
+import asyncio
 import io
+import struct
+from functools import lru_cache
 
 from google import genai
 from google.genai import types
@@ -18,6 +21,7 @@ from pydub import AudioSegment
 
 from .config import settings
 from .logger import logger
+from .ogg_opus import OPUS_AVAILABLE, OPUS_SAMPLE_RATES, encode_ogg_opus
 
 # Voice mappings by language code
 TTS_VOICES = {
@@ -29,19 +33,6 @@ TTS_VOICES = {
 }
 
 
-def get_voice_for_language(language: str) -> str:
-    """
-    Get the appropriate TTS voice for a language code.
-
-    Args:
-        language: ISO-639-1 language code (e.g., 'en', 'es')
-
-    Returns:
-        Voice name for Gemini TTS
-    """
-    return TTS_VOICES.get(language, settings.tts_default_voice)
-
-
 def validate_text_input(text: str) -> tuple[bool, str | None]:
     """
     Validate text input for TTS synthesis.
@@ -98,6 +89,31 @@ def create_genai_client(api_key: str | None) -> genai.Client | None:
         return None
 
 
+@lru_cache(maxsize=16)
+def _build_tts_config(voice_name: str) -> types.GenerateContentConfig:
+    """
+    Build the Gemini audio generation config for a voice.
+
+    Cached per voice since the config tree is identical across calls.
+
+    Args:
+        voice_name: Prebuilt Gemini voice name
+
+    Returns:
+        GenerateContentConfig requesting audio with the given voice
+    """
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice_name,
+                )
+            )
+        ),
+    )
+
+
 async def synthesize_speech(
     client: genai.Client, text: str, voice: str | None = None
 ) -> tuple[bytes | None, str | None]:
@@ -125,19 +141,11 @@ async def synthesize_speech(
         # Prepend TTS instruction to make intent clear to the model
         tts_prompt = f"Say the following text: {text}"
 
-        response = client.models.generate_content(
+        # Async client so the TTS round trip doesn't block the event loop
+        response = await client.aio.models.generate_content(
             model=settings.tts_model,
             contents=tts_prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice_name,
-                        )
-                    )
-                ),
-            ),
+            config=_build_tts_config(voice_name),
         )
 
         # Extract audio data from response
@@ -174,7 +182,7 @@ AUDIO_FORMATS = {
 }
 
 
-def pcm_to_audio(
+async def pcm_to_audio(
     pcm_data: bytes,
     output_format: str = "ogg",
     channels: int = 1,
@@ -184,6 +192,34 @@ def pcm_to_audio(
     """
     Convert raw PCM audio data to the specified format.
 
+    The conversion blocks on an ffmpeg subprocess for hundreds of ms,
+    so it runs in a worker thread to keep the event loop responsive.
+
+    Args:
+        pcm_data: Raw PCM audio bytes
+        output_format: Target format ('ogg', 'mp3', 'wav', 'flac')
+        channels: Number of audio channels (default: 1 for mono)
+        rate: Sample rate in Hz (default: 24000 for Gemini TTS)
+        sample_width: Sample width in bytes (default: 2 for 16-bit)
+
+    Returns:
+        Audio bytes in the specified format
+    """
+    return await asyncio.to_thread(
+        _pcm_to_audio_sync, pcm_data, output_format, channels, rate, sample_width
+    )
+
+
+def _pcm_to_audio_sync(
+    pcm_data: bytes,
+    output_format: str,
+    channels: int,
+    rate: int,
+    sample_width: int,
+) -> bytes:
+    """
+    Convert raw PCM audio data to the specified format (blocking).
+
     Pure function that converts PCM using pydub (requires ffmpeg).
 
     Args:
@@ -196,6 +232,20 @@ def pcm_to_audio(
     Returns:
         Audio bytes in the specified format
     """
+    # Voice notes: encode with libopus in-process instead of spawning ffmpeg
+    if (
+        output_format == "ogg"
+        and OPUS_AVAILABLE
+        and sample_width == 2
+        and channels in (1, 2)
+        and rate in OPUS_SAMPLE_RATES
+    ):
+        return encode_ogg_opus(pcm_data, rate, channels)
+
+    # WAV is just a RIFF header in front of the PCM (8-bit WAV is unsigned, leave it to pydub)
+    if output_format == "wav" and sample_width > 1:
+        return _pcm_to_wav(pcm_data, channels, rate, sample_width)
+
     audio = AudioSegment(
         data=pcm_data,
         sample_width=sample_width,
@@ -215,6 +265,39 @@ def pcm_to_audio(
     return buffer.getvalue()
 
 
+def _pcm_to_wav(pcm_data: bytes, channels: int, rate: int, sample_width: int) -> bytes:
+    """
+    Wrap raw PCM in a canonical 44-byte RIFF/WAVE header.
+
+    Args:
+        pcm_data: Raw PCM audio bytes (little-endian signed samples)
+        channels: Number of audio channels
+        rate: Sample rate in Hz
+        sample_width: Sample width in bytes
+
+    Returns:
+        WAV file bytes
+    """
+    block_align = channels * sample_width
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + len(pcm_data),
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        rate,
+        rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        len(pcm_data),
+    )
+    return header + pcm_data
+
+
 def get_audio_mimetype(output_format: str) -> str:
     """Get the MIME type for an audio format."""
     format_config = AUDIO_FORMATS.get(output_format, AUDIO_FORMATS["ogg"])
@@ -2,14 +2,25 @@
 Async HTTP client for WhatsApp REST API.
 
 Provides type-safe methods for all WhatsApp messaging operations.
-Uses httpx.AsyncClient passed via constructor for connection pooling.
+Uses httpx.AsyncClient passed via constructor for connection pooling
+(the process-wide client from ai_api.http_client by default).
 """
 
+import asyncio
+import io
 import logging
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import Any, BinaryIO
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
+from ..config import settings
+from ..http_client import get_http_client
 from .exceptions import (
     WhatsAppClientError,
     WhatsAppNotConnectedError,
@@ -18,8 +29,159 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Statuses with a dedicated exception, other errors raise WhatsAppClientError
+_ERROR_MAP: dict[int, type[WhatsAppClientError]] = {
+    503: WhatsAppNotConnectedError,
+    404: WhatsAppNotFoundError,
+}
 
-@dataclass
+# Warn once per process when running without uvloop
+_event_loop_checked = False
+
+# Log the negotiated protocol once per process (HTTP/2 needs TLS + ALPN, a
+# cleartext http:// bridge stays on pooled keep-alive HTTP/1.1)
+_http_version_logged = False
+
+# Last successful reaction/edit per message: (operation, phone, message_id) ->
+# (emoji or text sent, result). Retries and double-taps of the same value within
+# the TTL get the previous result without another request; any other value
+# evicts the entry, so going back to an earlier value is always sent.
+# Module-level because clients are created per request/job. No lock needed:
+# lookups and stores never straddle an await.
+_recent_results: TTLCache = TTLCache(maxsize=1024, ttl=2.0)
+
+# Caps requests in flight to the bridge across all clients in the process, so
+# bursts queue locally instead of piling up as 503s from a saturated bridge
+_request_slots = asyncio.Semaphore(settings.whatsapp_max_concurrency)
+
+# Requests currently on the wire, keyed by operation plus all its arguments
+_inflight: dict[tuple, asyncio.Task] = {}
+
+# Image types the bridge accepts (whatsapp-client src/utils/file-validation.ts)
+_ALLOWED_IMAGE_MIMES = frozenset({"image/jpeg", "image/png", "image/webp"})
+
+# Chunk size for streamed image uploads
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Multipart boundary for image uploads. Random like httpx's (it must never occur
+# in the payload) but generated once per process, so uploads reuse the framing
+# constants instead of httpx building a new boundary and encoder per send.
+_BOUNDARY = os.urandom(16).hex()
+_BOUNDARY_DELIMITER = f"--{_BOUNDARY}\r\n".encode()
+_MULTIPART_TAIL = f"\r\n--{_BOUNDARY}--\r\n".encode()
+_MULTIPART_CONTENT_TYPE = f"multipart/form-data; boundary={_BOUNDARY}"
+
+
+def _coalesce(
+    key: tuple, request: Callable[[], Coroutine[Any, Any, httpx.Response]]
+) -> Awaitable[httpx.Response]:
+    """
+    Share one in-flight request between identical concurrent calls.
+
+    The first caller starts the request, later callers with the same key
+    await it too and all get the same response. Each caller is shielded,
+    so cancelling one doesn't abort the request for the others.
+
+    Args:
+        key: Operation name plus its arguments
+        request: Starts the request when no identical one is in flight
+
+    Returns:
+        Awaitable for the response
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(request())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return asyncio.shield(task)
+
+
+def _recent_result(key: tuple, value: str) -> "SuccessResponse | None":
+    """
+    Get the cached result for a repeated reaction or edit.
+
+    Args:
+        key: Operation name, phone number and message ID
+        value: Emoji or text about to be sent
+
+    Returns:
+        Previous result if the last value sent for this message was the same,
+        None otherwise (a different value evicts the entry)
+    """
+    cached = _recent_results.get(key)
+    if cached is None:
+        return None
+    if cached[0] == value:
+        return cached[1]
+
+    del _recent_results[key]
+    return None
+
+
+def _sniff_image_type(data: bytes) -> str | None:
+    """
+    Detect an image's MIME type from its magic bytes.
+
+    Args:
+        data: Start of the file (at least 12 bytes for WebP)
+
+    Returns:
+        One of _ALLOWED_IMAGE_MIMES, or None for anything else
+    """
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def _present(**fields) -> dict:
+    """Keep only the optional fields that were given (non-empty values)."""
+    return {name: value for name, value in fields.items() if value}
+
+
+def _multipart_head(fields: dict[str, str], content_type: str) -> bytes:
+    """
+    Encode the multipart/form-data framing that precedes the file content.
+
+    Args:
+        fields: Form fields sent before the file
+        content_type: MIME type of the file part
+
+    Returns:
+        Field parts plus the "file" part headers
+    """
+    head = bytearray()
+    for name, value in fields.items():
+        head += _BOUNDARY_DELIMITER
+        head += f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+        head += value.encode()
+        head += b"\r\n"
+
+    head += _BOUNDARY_DELIMITER
+    head += b'Content-Disposition: form-data; name="file"; filename="image"\r\n'
+    head += f"Content-Type: {content_type}\r\n\r\n".encode()
+    return bytes(head)
+
+
+async def _multipart_body(head: bytes, file_chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield a multipart body: framing, file content, closing boundary."""
+    yield head
+    async for chunk in file_chunks:
+        yield chunk
+    yield _MULTIPART_TAIL
+
+
+async def _read_chunks(file: BinaryIO) -> AsyncIterator[bytes]:
+    """Yield the rest of a file object in IMAGE_CHUNK_SIZE chunks."""
+    while chunk := file.read(IMAGE_CHUNK_SIZE):
+        yield chunk
+
+
+@dataclass(slots=True, frozen=True)
 class SendMessageResponse:
     """Response from send message operations."""
 
@@ -27,7 +189,7 @@ class SendMessageResponse:
     message_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SuccessResponse:
     """Response from operations that only return success status."""
 
@@ -48,24 +210,110 @@ class WhatsAppClient:
         self._client = http_client
         self._base_url = base_url.rstrip("/")
 
-    async def _handle_response(self, response: httpx.Response) -> dict:
+        # Endpoint URLs are fixed per instance, parse them once
+        self._urls = {
+            name: httpx.URL(f"{self._base_url}/whatsapp/{path}")
+            for name, path in (
+                ("send_text", "send-text"),
+                ("send_reaction", "send-reaction"),
+                ("send_location", "send-location"),
+                ("send_contact", "send-contact"),
+                ("send_image", "send-image"),
+                ("edit_message", "edit-message"),
+                ("delete_message", "delete-message"),
+            )
+        }
+        self._json_headers = {"content-type": "application/json"}
+
+        # Set per request: the shared client's default timeout belongs to the agent tools
+        self._timeout = httpx.Timeout(settings.whatsapp_client_timeout, connect=5.0)
+
+    async def _send_json(
+        self, url: httpx.URL, payload: dict, method: str = "POST"
+    ) -> httpx.Response:
+        """
+        Send a JSON request body.
+
+        The body is encoded with orjson up front and handed to httpx as raw
+        bytes, instead of going through httpx's stdlib json encoding.
+
+        Args:
+            url: Endpoint URL
+            payload: JSON-serializable request body
+            method: HTTP method
+
+        Returns:
+            Raw httpx response (pass to _handle_response)
+        """
+        async with _request_slots:
+            return await self._client.request(
+                method,
+                url,
+                content=orjson.dumps(payload),
+                headers=self._json_headers,
+                timeout=self._timeout,
+            )
+
+    def _handle_response(self, response: httpx.Response) -> dict:
         """Handle HTTP response and raise appropriate errors."""
-        if response.status_code == 503:
-            raise WhatsAppNotConnectedError()
+        global _http_version_logged
+        if not _http_version_logged:
+            _http_version_logged = True
+            logger.info("WhatsApp API connection uses %s", response.http_version)
 
-        if response.status_code == 404:
-            error_data = response.json()
-            raise WhatsAppNotFoundError(error_data.get("error", "Not found"))
+        status_code = response.status_code
 
-        if response.status_code >= 400:
-            try:
-                error_data = response.json()
-                error_msg = error_data.get("error", "Unknown error")
-            except Exception:
-                error_msg = response.text or "Unknown error"
-            raise WhatsAppClientError(error_msg, status_code=response.status_code)
+        # Common case first: success responses skip the error checks
+        if status_code < 400:
+            return orjson.loads(response.content)
+
+        error_class = _ERROR_MAP.get(status_code)
+        if error_class is WhatsAppNotConnectedError:
+            raise error_class()
+
+        default_msg = "Not found" if error_class is WhatsAppNotFoundError else "Unknown error"
+        try:
+            error_msg = orjson.loads(response.content).get("error", default_msg)
+        except (orjson.JSONDecodeError, AttributeError):
+            error_msg = response.text or default_msg
+
+        if error_class is not None:
+            raise error_class(error_msg)
+        raise WhatsAppClientError(error_msg, status_code=status_code)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[list[Coroutine]]:
+        """
+        Run several independent operations concurrently.
+
+        Calls added inside the block are not awaited individually; they are
+        sent together on exit, so N operations cost about one round trip
+        instead of N. After the block the list holds the results in order.
+
+        Example:
+            async with client.batch() as ops:
+                ops.append(client.send_reaction(jid, message_id, "👍"))
+                ops.append(client.send_text(jid, "Done!"))
+            reaction, sent = ops
 
-        return response.json()
+        Operations that depend on an earlier result (e.g. editing a message
+        that is being sent) must be awaited outside the batch.
+
+        Yields:
+            List to append un-awaited client calls to
+        """
+        operations: list[Coroutine] = []
+        try:
+            yield operations
+        except BaseException:
+            # Block failed, don't send anything queued so far
+            for operation in operations:
+                operation.close()
+            raise
+
+        if operations:
+            logger.info("Sending batch of %d WhatsApp operations", len(operations))
+            operations[:] = await asyncio.gather(*operations)
 
     async def send_text(
         self,
@@ -84,17 +332,19 @@ class WhatsAppClient:
         Returns:
             SendMessageResponse with success status and message_id
         """
-        payload: dict = {"phoneNumber": phone_number, "text": text}
-        if quoted_message_id:
-            payload["quoted_message_id"] = quoted_message_id
+        payload = {
+            "phoneNumber": phone_number,
+            "text": text,
+            **_present(quoted_message_id=quoted_message_id),
+        }
 
-        logger.info(f"Sending text to {phone_number[:8]}...")
+        logger.info("Sending text to %.8s...", phone_number)
 
-        response = await self._client.post(
-            f"{self._base_url}/whatsapp/send-text",
-            json=payload,
+        response = await self._send_json(
+            self._urls["send_text"],
+            payload,
         )
-        data = await self._handle_response(response)
+        data = self._handle_response(response)
         return SendMessageResponse(
             success=data.get("success", False),
             message_id=data.get("message_id"),
@@ -117,18 +367,30 @@ class WhatsAppClient:
         Returns:
             SuccessResponse indicating operation result
         """
-        logger.info(f"Sending reaction {emoji} to message {message_id[:8]}...")
-
-        response = await self._client.post(
-            f"{self._base_url}/whatsapp/send-reaction",
-            json={
-                "phoneNumber": phone_number,
-                "message_id": message_id,
-                "emoji": emoji,
-            },
-        )
-        data = await self._handle_response(response)
-        return SuccessResponse(success=data.get("success", False))
+        key = ("send_reaction", phone_number, message_id)
+        cached = _recent_result(key, emoji)
+        if cached is not None:
+            logger.debug("Skipping duplicate reaction %s to message %.8s", emoji, message_id)
+            return cached
+
+        async def request() -> httpx.Response:
+            # Runs once per coalesced group, so the log matches real sends
+            logger.info("Sending reaction %s to message %.8s...", emoji, message_id)
+            return await self._send_json(
+                self._urls["send_reaction"],
+                {
+                    "phoneNumber": phone_number,
+                    "message_id": message_id,
+                    "emoji": emoji,
+                },
+            )
+
+        response = await _coalesce((*key, emoji), request)
+        data = self._handle_response(response)
+        result = SuccessResponse(success=data.get("success", False))
+        if result.success:
+            _recent_results[key] = (emoji, result)
+        return result
 
     async def send_location(
         self,
@@ -151,23 +413,20 @@ class WhatsAppClient:
         Returns:
             SendMessageResponse with success status and message_id
         """
-        payload: dict = {
+        payload = {
             "phoneNumber": phone_number,
             "latitude": latitude,
             "longitude": longitude,
+            **_present(name=name, address=address),
         }
-        if name:
-            payload["name"] = name
-        if address:
-            payload["address"] = address
 
-        logger.info(f"Sending location ({latitude}, {longitude}) to {phone_number[:8]}...")
+        logger.info("Sending location (%s, %s) to %.8s...", latitude, longitude, phone_number)
 
-        response = await self._client.post(
-            f"{self._base_url}/whatsapp/send-location",
-            json=payload,
+        response = await self._send_json(
+            self._urls["send_location"],
+            payload,
         )
-        data = await self._handle_response(response)
+        data = self._handle_response(response)
         return SendMessageResponse(
             success=data.get("success", False),
             message_id=data.get("message_id"),
@@ -194,23 +453,20 @@ class WhatsAppClient:
         Returns:
             SendMessageResponse with success status and message_id
         """
-        payload: dict = {
+        payload = {
             "phoneNumber": phone_number,
             "contactName": contact_name,
             "contactPhone": contact_phone,
+            **_present(contactEmail=contact_email, contactOrg=contact_org),
         }
-        if contact_email:
-            payload["contactEmail"] = contact_email
-        if contact_org:
-            payload["contactOrg"] = contact_org
 
-        logger.info(f"Sending contact '{contact_name}' to {phone_number[:8]}...")
+        logger.info("Sending contact '%s' to %.8s...", contact_name, phone_number)
 
-        response = await self._client.post(
-            f"{self._base_url}/whatsapp/send-contact",
-            json=payload,
+        response = await self._send_json(
+            self._urls["send_contact"],
+            payload,
         )
-        data = await self._handle_response(response)
+        data = self._handle_response(response)
         return SendMessageResponse(
             success=data.get("success", False),
             message_id=data.get("message_id"),
@@ -219,7 +475,7 @@ class WhatsAppClient:
     async def send_image(
         self,
         phone_number: str,
-        image_data: bytes,
+        image_data: bytes | BinaryIO,
         content_type: str = "image/jpeg",
         caption: str | None = None,
     ) -> SendMessageResponse:
@@ -228,26 +484,39 @@ class WhatsAppClient:
 
         Args:
             phone_number: WhatsApp JID or phone number
-            image_data: Image bytes
+            image_data: Image bytes or a binary file object positioned at the start
             content_type: MIME type of the image
             caption: Optional caption for the image
 
         Returns:
             SendMessageResponse with success status and message_id
         """
-        files = {"file": ("image", image_data, content_type)}
-        data: dict = {"phoneNumber": phone_number}
-        if caption:
-            data["caption"] = caption
+        # The file is streamed in chunks after the precomputed framing
+        # (BytesIO shares the bytes buffer, nothing is copied up front)
+        if isinstance(image_data, (bytes, bytearray)):
+            image_data = io.BytesIO(image_data)
 
-        logger.info(f"Sending image to {phone_number[:8]}...")
+        start = image_data.tell()
+        size = image_data.seek(0, io.SEEK_END) - start
+        image_data.seek(start)
 
-        response = await self._client.post(
-            f"{self._base_url}/whatsapp/send-image",
-            files=files,
-            data=data,
+        head = _multipart_head(
+            {"phoneNumber": phone_number, **_present(caption=caption)}, content_type
         )
-        result = await self._handle_response(response)
+
+        logger.info("Sending image to %.8s...", phone_number)
+
+        async with _request_slots:
+            response = await self._client.post(
+                self._urls["send_image"],
+                content=_multipart_body(head, _read_chunks(image_data)),
+                headers={
+                    "content-type": _MULTIPART_CONTENT_TYPE,
+                    "content-length": str(len(head) + size + len(_MULTIPART_TAIL)),
+                },
+                timeout=self._timeout,
+            )
+        result = self._handle_response(response)
         return SendMessageResponse(
             success=result.get("success", False),
             message_id=result.get("message_id"),
@@ -273,33 +542,97 @@ class WhatsAppClient:
             SendMessageResponse with success status and message_id
 
         Raises:
-            WhatsAppClientError: If URL is invalid, download fails, or file too large
+            WhatsAppClientError: If URL is invalid, download fails, the file is not a
+                JPEG/PNG/WebP image, or it is too large
         """
         if not image_url.startswith("https://"):
             raise WhatsAppClientError("Only HTTPS URLs are allowed for security")
 
-        logger.info(f"Downloading image from {image_url[:50]}...")
+        logger.info("Downloading image from %.50s...", image_url)
+
+        max_bytes = max_size_mb * 1024 * 1024
 
         try:
-            img_response = await self._client.get(image_url, follow_redirects=True)
-            img_response.raise_for_status()
+            img_response = await self._client.send(
+                self._client.build_request("GET", image_url, timeout=self._timeout),
+                stream=True,
+                follow_redirects=True,
+            )
         except httpx.HTTPError as e:
             raise WhatsAppClientError(f"Failed to download image: {e}")
 
-        content_type = img_response.headers.get("content-type", "")
-        if not content_type.startswith("image/"):
-            raise WhatsAppClientError(f"URL does not point to an image: {content_type}")
-
-        image_data = img_response.content
-        size_mb = len(image_data) / (1024 * 1024)
-        if size_mb > max_size_mb:
-            raise WhatsAppClientError(f"Image too large: {size_mb:.1f}MB (max {max_size_mb}MB)")
-
-        return await self.send_image(
-            phone_number=phone_number,
-            image_data=image_data,
-            content_type=content_type,
-            caption=caption,
+        try:
+            if img_response.status_code >= 400:
+                raise WhatsAppClientError(
+                    f"Failed to download image: HTTP {img_response.status_code} "
+                    f"{img_response.reason_phrase}"
+                )
+
+            # Reject declared oversized downloads before reading any of the body
+            content_length = img_response.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > max_bytes:
+                size_mb = int(content_length) / (1024 * 1024)
+                raise WhatsAppClientError(f"Image too large: {size_mb:.1f}MB (max {max_size_mb}MB)")
+
+            # The type comes from the file's magic bytes, not the server's header,
+            # so mislabelled images still go through and non-images never do
+            downloaded = img_response.aiter_bytes(IMAGE_CHUNK_SIZE)
+            try:
+                first_chunk = await anext(downloaded, b"")
+            except httpx.HTTPError as e:
+                raise WhatsAppClientError(f"Failed to download image: {e}")
+
+            content_type = _sniff_image_type(first_chunk)
+            if content_type is None:
+                declared = img_response.headers.get("content-type", "")
+                raise WhatsAppClientError(
+                    f"URL does not point to a supported image ({declared or 'unknown type'}). "
+                    f"Allowed types: {', '.join(sorted(_ALLOWED_IMAGE_MIMES))}"
+                )
+
+            async def image_chunks() -> AsyncIterator[bytes]:
+                # Enforce the limit while downloading so oversized files are cut off
+                # early (the upload fails with this error mid-stream)
+                size = len(first_chunk)
+                if size > max_bytes:
+                    raise WhatsAppClientError(f"Image too large (max {max_size_mb}MB)")
+                yield first_chunk
+
+                try:
+                    async for chunk in downloaded:
+                        size += len(chunk)
+                        if size > max_bytes:
+                            raise WhatsAppClientError(f"Image too large (max {max_size_mb}MB)")
+                        yield chunk
+                except httpx.HTTPError as e:
+                    raise WhatsAppClientError(f"Failed to download image: {e}")
+
+            head = _multipart_head(
+                {"phoneNumber": phone_number, **_present(caption=caption)}, content_type
+            )
+
+            logger.info("Sending image to %.8s...", phone_number)
+
+            # Pipe the download into the upload: chunks are forwarded as they
+            # arrive, so both transfers overlap instead of running back to back.
+            # The slot is only taken once the image host has answered with a valid
+            # image, but since the upload pulls the rest of the download, a host
+            # that stalls mid-body holds it until the read timeout. That's the
+            # cost of not buffering whole images in memory first.
+            async with _request_slots:
+                response = await self._client.post(
+                    self._urls["send_image"],
+                    content=_multipart_body(head, image_chunks()),
+                    headers={"content-type": _MULTIPART_CONTENT_TYPE},
+                    timeout=self._timeout,
+                )
+        finally:
+            await img_response.aclose()
+
+        result = self._handle_response(response)
+        return SendMessageResponse(
+            success=result.get("success", False),
+            message_id=result.get("message_id"),
         )
 
     async def edit_message(
@@ -319,18 +652,29 @@ class WhatsAppClient:
         Returns:
             SuccessResponse indicating operation result
         """
-        logger.info(f"Editing message {message_id[:8]}...")
-
-        response = await self._client.post(
-            f"{self._base_url}/whatsapp/edit-message",
-            json={
-                "phoneNumber": phone_number,
-                "message_id": message_id,
-                "new_text": new_text,
-            },
-        )
-        data = await self._handle_response(response)
-        return SuccessResponse(success=data.get("success", False))
+        key = ("edit_message", phone_number, message_id)
+        cached = _recent_result(key, new_text)
+        if cached is not None:
+            logger.debug("Skipping duplicate edit of message %.8s", message_id)
+            return cached
+
+        async def request() -> httpx.Response:
+            logger.info("Editing message %.8s...", message_id)
+            return await self._send_json(
+                self._urls["edit_message"],
+                {
+                    "phoneNumber": phone_number,
+                    "message_id": message_id,
+                    "new_text": new_text,
+                },
+            )
+
+        response = await _coalesce((*key, new_text), request)
+        data = self._handle_response(response)
+        result = SuccessResponse(success=data.get("success", False))
+        if result.success:
+            _recent_results[key] = (new_text, result)
+        return result
 
     async def delete_message(
         self,
@@ -347,32 +691,57 @@ class WhatsAppClient:
         Returns:
             SuccessResponse indicating operation result
         """
-        logger.info(f"Deleting message {message_id[:8]}...")
-
-        response = await self._client.request(
-            "DELETE",
-            f"{self._base_url}/whatsapp/delete-message",
-            json={
-                "phoneNumber": phone_number,
-                "message_id": message_id,
-            },
-        )
-        data = await self._handle_response(response)
+        key = ("delete_message", phone_number, message_id)
+
+        async def request() -> httpx.Response:
+            logger.info("Deleting message %.8s...", message_id)
+            return await self._send_json(
+                self._urls["delete_message"],
+                {
+                    "phoneNumber": phone_number,
+                    "message_id": message_id,
+                },
+                method="DELETE",
+            )
+
+        response = await _coalesce(key, request)
+        data = self._handle_response(response)
         return SuccessResponse(success=data.get("success", False))
 
 
 def create_whatsapp_client(
-    http_client: httpx.AsyncClient,
-    base_url: str,
+    http_client: httpx.AsyncClient | None = None,
+    base_url: str | None = None,
 ) -> WhatsAppClient:
     """
     Factory function for creating WhatsApp client.
 
+    Entry points are expected to run on uvloop (uvicorn picks it up
+    automatically, the worker scripts install it), which makes the many
+    small request/response round trips to the bridge noticeably cheaper.
+    A warning is logged once if the stdlib event loop is in use.
+
     Args:
-        http_client: Shared httpx.AsyncClient
-        base_url: WhatsApp client REST API base URL
+        http_client: Shared httpx.AsyncClient (default: process-wide pooled client)
+        base_url: WhatsApp client REST API base URL (default: WHATSAPP_CLIENT_URL)
 
     Returns:
         Configured WhatsAppClient instance
     """
-    return WhatsAppClient(http_client=http_client, base_url=base_url)
+    global _event_loop_checked
+    if not _event_loop_checked:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            _event_loop_checked = True
+            if type(loop).__module__.startswith("asyncio"):
+                logger.warning(
+                    "WhatsApp client running on the stdlib asyncio loop, uvloop not in use"
+                )
+
+    return WhatsAppClient(
+        http_client=http_client or get_http_client(),
+        base_url=base_url or settings.whatsapp_client_url,
+    )